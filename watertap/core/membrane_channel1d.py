@@ -34,6 +34,27 @@ from watertap.core.membrane_channel_base import (
     CONFIG_Template as Base_CONFIG_Template,
 )
 
+
+_DOC_AREA_DEFINITION = """Argument defining whether area variable should be spatially
+variant or not. **default** - DistributedVars.uniform.
+**Valid values:** {
+DistributedVars.uniform - area does not vary across spatial domain,
+DistributedVars.variant - area can vary over the domain and is indexed
+by time and space.}"""
+
+_DOC_TRANSFORMATION_METHOD = """Discretization method to use for DAE transformation. See Pyomo
+documentation for supported transformations."""
+
+_DOC_TRANSFORMATION_SCHEME = """Discretization scheme to use when transforming domain. See
+Pyomo documentation for supported schemes."""
+
+_DOC_FINITE_ELEMENTS = """Number of finite elements to use when discretizing length 
+        domain (default=10)"""
+
+_DOC_COLLOCATION_POINTS = """Number of collocation points to use per finite element when
+        discretizing length domain (default=5)"""
+
+
 CONFIG_Template = Base_CONFIG_Template()
 
 CONFIG_Template.declare(
@@ -42,12 +63,7 @@ CONFIG_Template.declare(
         default=DistributedVars.uniform,
         domain=In(DistributedVars),
         description="Argument for defining form of area variable",
-        doc="""Argument defining whether area variable should be spatially
-variant or not. **default** - DistributedVars.uniform.
-**Valid values:** {
-DistributedVars.uniform - area does not vary across spatial domain,
-DistributedVars.variant - area can vary over the domain and is indexed
-by time and space.}""",
+        doc=_DOC_AREA_DEFINITION,
     ),
 )
 
@@ -56,8 +72,7 @@ CONFIG_Template.declare(
     ConfigValue(
         default=useDefault,
         description="Discretization method to use for DAE transformation",
-        doc="""Discretization method to use for DAE transformation. See Pyomo
-documentation for supported transformations.""",
+        doc=_DOC_TRANSFORMATION_METHOD,
     ),
 )
 
@@ -66,8 +81,7 @@ CONFIG_Template.declare(
     ConfigValue(
         default=useDefault,
         description="Discretization scheme to use for DAE transformation",
-        doc="""Discretization scheme to use when transforming domain. See
-Pyomo documentation for supported schemes.""",
+        doc=_DOC_TRANSFORMATION_SCHEME,
     ),
 )
 
@@ -77,8 +91,7 @@ CONFIG_Template.declare(
         default=10,
         domain=int,
         description="Number of finite elements in length domain",
-        doc="""Number of finite elements to use when discretizing length 
-        domain (default=10)""",
+        doc=_DOC_FINITE_ELEMENTS,
     ),
 )
 
@@ -88,25 +101,33 @@ CONFIG_Template.declare(
         default=5,
         domain=int,
         description="Number of collocation points per finite element",
-        doc="""Number of collocation points to use per finite element when
-        discretizing length domain (default=5)""",
+        doc=_DOC_COLLOCATION_POINTS,
     ),
 )
 
 
 @declare_process_block_class("MembraneChannel1DBlock")
 class MembraneChannel1DBlockData(MembraneChannelMixin, ControlVolume1DBlockData):
+    # set by _add_pressure_change once dP_dx has been added
+    _has_dPdx = False
+
+    # Constraints over the length domain are declared before
+    # apply_transformation and are expanded by the DAE transformation,
+    # so they have to stay indexed by length_domain and skip the boundary
+    # element in their rule instead of using a reduced index set.
     def _skip_element(self, x):
         if self.config.transformation_scheme != "FORWARD":
-            return x == self.length_domain.first()
+            return x == self.first_element
         else:
-            return x == self.length_domain.last()
+            return x == self.last_element
 
     def apply_transformation(self, *args, **kwargs):
         super().apply_transformation(*args, **kwargs)
         self.difference_elements = Set(
             ordered=True,
-            initialize=(x for x in self.length_domain if not self._skip_element(x)),
+            initialize=tuple(
+                x for x in self.length_domain if not self._skip_element(x)
+            ),
         )
         self._set_nfe()
 
@@ -164,6 +185,7 @@ class MembraneChannel1DBlockData(MembraneChannelMixin, ControlVolume1DBlockData)
 
     def _add_pressure_change(self, pressure_change_type=PressureChangeType.calculated):
         add_object_reference(self, "dP_dx", self.deltaP)
+        self._has_dPdx = True
 
     def initialize(
         self,
@@ -256,11 +278,10 @@ class MembraneChannel1DBlockData(MembraneChannelMixin, ControlVolume1DBlockData)
         if iscale.get_scaling_factor(self.area) == 1:
             iscale.set_scaling_factor(self.area, 100)
 
+        # set on the indexed components, which also sets each data object;
+        # overwrite=False leaves any user provided scaling factors in place
         if hasattr(self, "pressure_change_total"):
-            for v in self.pressure_change_total.values():
-                if iscale.get_scaling_factor(v) is None:
-                    iscale.set_scaling_factor(v, 1e-4)
+            iscale.set_scaling_factor(self.pressure_change_total, 1e-4, overwrite=False)
 
-        if hasattr(self, "dP_dx"):
-            for v in self.pressure_dx.values():
-                iscale.set_scaling_factor(v, 1e-5)
+        if self._has_dPdx:
+            iscale.set_scaling_factor(self.pressure_dx, 1e-5)
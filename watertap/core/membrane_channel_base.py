@@ -315,15 +315,29 @@ class MembraneChannelMixin:
                 )
             add_object_reference(self, reference_name, pyomo_var)
 
-    def _set_nfe(self):
-        self.first_element = self.length_domain.first()
-        self.last_element = self.length_domain.last()
+    # the end points of the length domain are not changed by the DAE
+    # transformation, so they are looked up once and cached for the rules
+    # built before and after it
+    @property
+    def first_element(self):
+        try:
+            return self._first_element
+        except AttributeError:
+            self._first_element = self.length_domain.first()
+            return self._first_element
+
+    @property
+    def last_element(self):
+        try:
+            return self._last_element
+        except AttributeError:
+            self._last_element = self.length_domain.last()
+            return self._last_element
 
-        self.nfe = Param(
-            initialize=(len(self.difference_elements)),
-            units=pyunits.dimensionless,
-            doc="Number of finite elements",
-        )
+    def _set_nfe(self):
+        # number of finite elements; a plain int as it is only ever read
+        # as a constant when building expressions
+        self.nfe = len(self.difference_elements)
 
     def add_total_pressure_balances(
         self,
@@ -374,18 +388,22 @@ class MembraneChannelMixin:
 
         ## ==========================================================================
         # Feed-side isothermal conditions
+        time = self.flowsheet().config.time
+        x_in = self.first_element
+        # the inlet temperature is shared by every element at a given time,
+        # so it is looked up once per time point rather than once per (t, x);
+        # the rule is kept so the DAE transformation can expand the constraint
+        temperature_in = {t: self.properties[t, x_in].temperature for t in time}
+
         @self.Constraint(
-            self.flowsheet().config.time,
+            time,
             self.length_domain,
             doc="Isothermal assumption for feed channel",
         )
         def eq_feed_isothermal(b, t, x):
-            if x == b.length_domain.first():
+            if x == x_in:
                 return Constraint.Skip
-            return (
-                b.properties[t, b.length_domain.first()].temperature
-                == b.properties[t, x].temperature
-            )
+            return temperature_in[t] == b.properties[t, x].temperature
 
     def add_extensive_flow_to_interface(self):
         # VOLUMETRIC FLOWRATE
@@ -408,13 +426,14 @@ class MembraneChannelMixin:
         mass_transfer_coefficient=MassTransferCoefficient.calculated,
     ):
 
+        time = self.flowsheet().config.time
         solute_set = self.config.property_package.solute_set
         units_meta = self.config.property_package.get_metadata().get_derived_units
 
         if concentration_polarization_type == ConcentrationPolarizationType.none:
 
             @self.Constraint(
-                self.flowsheet().config.time,
+                time,
                 self.length_domain,
                 solute_set,
                 doc="Unit concentration polarization modulus",
@@ -438,7 +457,7 @@ class MembraneChannelMixin:
             )
 
         self.cp_modulus = Var(
-            self.flowsheet().config.time,
+            time,
             self.length_domain,
             solute_set,
             initialize=1.1,
@@ -449,7 +468,7 @@ class MembraneChannelMixin:
         )
 
         @self.Constraint(
-            self.flowsheet().config.time,
+            time,
             self.length_domain,
             solute_set,
             doc="Concentration polarization modulus",
@@ -469,7 +488,7 @@ class MembraneChannelMixin:
 
             # mass_transfer_coefficient is either calculated or fixed
             self.K = Var(
-                self.flowsheet().config.time,
+                time,
                 self.length_domain,
                 solute_set,
                 initialize=5e-5,
@@ -488,19 +507,18 @@ class MembraneChannelMixin:
         """
         Generate expressions for additional results desired for full report
         """
+        time = self.flowsheet().config.time
 
         if hasattr(self, "N_Re"):
 
-            @self.Expression(
-                self.flowsheet().config.time, doc="Average Reynolds Number expression"
-            )
+            @self.Expression(time, doc="Average Reynolds Number expression")
             def N_Re_avg(b, t):
                 return sum(b.N_Re[t, x] for x in self.length_domain) / self.nfe
 
         if hasattr(self, "K"):
 
             @self.Expression(
-                self.flowsheet().config.time,
+                time,
                 self.config.property_package.solute_set,
                 doc="Average mass transfer coefficient expression",
             )
@@ -511,10 +529,11 @@ class MembraneChannelMixin:
     def _add_calculated_mass_transfer_coefficient(self):
         self._add_calculated_pressure_change_mass_transfer_components()
 
+        time = self.flowsheet().config.time
         solute_set = self.config.property_package.solute_set
 
         self.N_Sc_comp = Var(
-            self.flowsheet().config.time,
+            time,
             self.length_domain,
             solute_set,
             initialize=5e2,
@@ -524,7 +543,7 @@ class MembraneChannelMixin:
             doc="Schmidt number in membrane channel",
         )
         self.N_Sh_comp = Var(
-            self.flowsheet().config.time,
+            time,
             self.length_domain,
             solute_set,
             initialize=1e2,
@@ -535,7 +554,7 @@ class MembraneChannelMixin:
         )
 
         @self.Constraint(
-            self.flowsheet().config.time,
+            time,
             self.length_domain,
             self.config.property_package.solute_set,
             doc="Mass transfer coefficient in membrane channel",
@@ -550,7 +569,7 @@ class MembraneChannelMixin:
             )
 
         @self.Constraint(
-            self.flowsheet().config.time,
+            time,
             self.length_domain,
             self.config.property_package.solute_set,
             doc="Sherwood number",
@@ -562,7 +581,7 @@ class MembraneChannelMixin:
             )
 
         @self.Constraint(
-            self.flowsheet().config.time,
+            time,
             self.length_domain,
             self.config.property_package.solute_set,
             doc="Schmidt number",
@@ -590,6 +609,7 @@ class MembraneChannelMixin:
                 f"Due to either a calculated mass transfer coefficient or a calculated pressure change, a ``width`` variable needs to be supplied to `add_geometry` for this MembraneChannel"
             )
 
+        time = self.flowsheet().config.time
         units_meta = self.config.property_package.get_metadata().get_derived_units
 
         if not hasattr(self, "area"):
@@ -627,7 +647,7 @@ class MembraneChannelMixin:
         )
 
         self.N_Re = Var(
-            self.flowsheet().config.time,
+            time,
             self.length_domain,
             initialize=5e2,
             bounds=(10, 5e3),
@@ -646,9 +666,7 @@ class MembraneChannelMixin:
         def eq_area(b):
             return b.area == b.channel_height * b.width * b.spacer_porosity
 
-        @self.Constraint(
-            self.flowsheet().config.time, self.length_domain, doc="Reynolds number"
-        )
+        @self.Constraint(time, self.length_domain, doc="Reynolds number")
         def eq_N_Re(b, t, x):
             return (
                 b.N_Re[t, x] * b.area * b.properties[t, x].visc_d_phase["Liq"]
@@ -687,9 +705,10 @@ class MembraneChannelMixin:
         self._add_calculated_pressure_change_mass_transfer_components()
 
         units_meta = self.config.property_package.get_metadata().get_derived_units
+        time = self.flowsheet().config.time
 
         self.velocity = Var(
-            self.flowsheet().config.time,
+            time,
             self.length_domain,
             initialize=0.5,
             bounds=(1e-2, 5),
@@ -698,7 +717,7 @@ class MembraneChannelMixin:
             doc="Crossflow velocity in feed channel",
         )
         self.friction_factor_darcy = Var(
-            self.flowsheet().config.time,
+            time,
             self.length_domain,
             initialize=0.5,
             bounds=(1e-2, 5),
@@ -713,7 +732,7 @@ class MembraneChannelMixin:
         ## ==========================================================================
         # Crossflow velocity
         @self.Constraint(
-            self.flowsheet().config.time,
+            time,
             self.length_domain,
             doc="Crossflow velocity constraint",
         )
@@ -725,7 +744,7 @@ class MembraneChannelMixin:
         if friction_factor == FrictionFactor.flat_sheet:
 
             @self.Constraint(
-                self.flowsheet().config.time,
+                time,
                 self.length_domain,
                 doc="Darcy friction factor constraint for flat sheet membranes",
             )
@@ -736,7 +755,7 @@ class MembraneChannelMixin:
         elif friction_factor == FrictionFactor.spiral_wound:
 
             @self.Constraint(
-                self.flowsheet().config.time,
+                time,
                 self.length_domain,
                 doc="Darcy friction factor constraint for spiral-wound membranes",
             )
@@ -752,7 +771,7 @@ class MembraneChannelMixin:
         # Pressure change per unit length due to friction
         # -1/2*f/dh*density*velocity^2
         @self.Constraint(
-            self.flowsheet().config.time,
+            time,
             self.length_domain,
             doc="pressure change per unit length due to friction",
         )
@@ -796,9 +815,9 @@ class MembraneChannelMixin:
         # Get source block
         # TODO: need to re-visit for counterflow
         if self._flow_direction == FlowDirection.forward:
-            source_idx = self.length_domain.first()
+            source_idx = self.first_element
         else:
-            source_idx = self.length_domain.last()
+            source_idx = self.last_element
         source = self.properties[self.flowsheet().config.time.first(), source_idx]
 
         if state_args is None:
@@ -238,42 +238,47 @@ class GACData(InitializationMixin, UnitModelBlockData):
                 "If the isothermal assumption is used then the energy balance type must be none"
             )
 
+        # target_species is checked here, before any components are added to the block
+        if self.config.target_species is None:
+            if len(self.config.property_package.solute_set) != 1:
+                raise ConfigurationError(
+                    "'target species' is not specified for the GAC unit model, either specify 'target species'"
+                    " argument or reduce solute set to a single component"
+                )
+        else:
+            for str_species in self.config.target_species:
+                if not isinstance(str_species, str):
+                    raise ConfigurationError(
+                        f"item {str_species} within 'target_species' list is not of data type str"
+                    )
+                if str_species not in self.config.property_package.component_list:
+                    raise ConfigurationError(
+                        f"item {str_species} within 'target_species' list is not in 'component_list'"
+                    )
+
     # ---------------------------------------------------------------------
     def build(self):
 
         super().build()
 
+        # Check configs for errors
+        self._validate_config()
+
         # create blank scaling factors to be populated later
         self.scaling_factor = Suffix(direction=Suffix.EXPORT)
         # get default units from property package
         units_meta = self.config.property_package.get_metadata().get_derived_units
-        # Check configs for errors
-        self._validate_config()
 
         # ---------------------------------------------------------------------
         # separate target_species to be adsorbed and other species considered inert
         # apply target_species automatically if arg left to default and only one viable option exists
 
         if self.config.target_species is None:
-            if len(self.config.property_package.solute_set) == 1:
-                self.config.target_species = self.config.property_package.solute_set
-                self.target_species = self.config.target_species
-            else:
-                raise ConfigurationError(
-                    "'target species' is not specified for the GAC unit model, either specify 'target species'"
-                    " argument or reduce solute set to a single component"
-                )
+            self.config.target_species = self.config.property_package.solute_set
+            self.target_species = self.config.target_species
         else:
             self.target_species = Set(dimen=1)
             for str_species in self.config.target_species:
-                if not isinstance(str_species, str):
-                    raise ConfigurationError(
-                        f"item {str_species} within 'target_species' list is not of data type str"
-                    )
-                if str_species not in self.config.property_package.component_list:
-                    raise ConfigurationError(
-                        f"item {str_species} within 'target_species' list is not in 'component_list'"
-                    )
                 self.target_species.add(str_species)
 
         self.inert_species = Set(
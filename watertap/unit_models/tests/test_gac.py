@@ -10,6 +10,9 @@
 # "https://github.com/watertap-org/watertap/"
 #################################################################################
 
+from io import StringIO
+import re
+
 import pytest
 import pyomo.environ as pyo
 from pyomo.environ import (
@@ -40,6 +43,7 @@ from idaes.core.util.scaling import (
     badly_scaled_var_generator,
 )
 from idaes.core.util.exceptions import ConfigurationError
+from idaes.core.util.misc import add_object_reference
 from idaes.core import UnitModelCostingBlock
 
 from watertap.property_models.multicomp_aq_sol_prop_pack import (
@@ -51,104 +55,161 @@ from watertap.unit_models.gac import (
     FilmTransferCoefficientType,
     SurfaceDiffusionCoefficientType,
 )
-from watertap.costing import WaterTAPCosting
 
 __author__ = "Hunter Barber"
 
-solver = get_solver()
+
+@pytest.fixture(scope="module")
+def solver():
+    return get_solver()
+
 
 # inputs for badly_scaled_var_generator used across test frames
 sv_large = 1e2
 sv_small = 1e-2
 sv_zero = 1e-8
 
-# -----------------------------------------------------------------------------
-class TestGACSimplified:
-    @pytest.fixture(scope="class")
-    def gac_frame_simplified(self):
-        ms = ConcreteModel()
-        ms.fs = FlowsheetBlock(dynamic=False)
-
-        ms.fs.properties = MCASParameterBlock(
-            solute_list=["DCE"],
-            mw_data={"H2O": 0.018, "DCE": 0.09896},
-        )
-        ms.fs.unit = GAC(
-            property_package=ms.fs.properties,
-            film_transfer_coefficient_type="fixed",
-            surface_diffusion_coefficient_type="fixed",
-        )
 
-        # feed specifications
-        ms.fs.unit.process_flow.properties_in[0].pressure.fix(
-            101325
-        )  # feed pressure [Pa]
-        ms.fs.unit.process_flow.properties_in[0].temperature.fix(
-            273.15 + 25
-        )  # feed temperature [K]
-        ms.fs.unit.process_flow.properties_in[0].flow_mol_phase_comp["Liq", "H2O"].fix(
-            55555.55426666667
-        )
-        ms.fs.unit.process_flow.properties_in[0].flow_mol_phase_comp["Liq", "DCE"].fix(
-            0.0002344381568310428
+def _first_badly_scaled_var(m):
+    # first (var, scaled value) pair outside the bounds above, or None
+    return next(
+        badly_scaled_var_generator(m, large=sv_large, small=sv_small, zero=sv_zero),
+        None,
+    )
+
+
+def _badly_scaled_var_list(m):
+    # (name, scaled value) of every badly scaled var, for assertion messages
+    return [
+        (v.name, sv)
+        for v, sv in badly_scaled_var_generator(
+            m, large=sv_large, small=sv_small, zero=sv_zero
         )
+    ]
 
-        # trial problem from Hand, 1984 for removal of trace DCE
-        # adsorption isotherm
-        ms.fs.unit.freund_k.fix(37.9e-6 * (1e6**0.8316))
-        ms.fs.unit.freund_ninv.fix(0.8316)
-        # gac particle specifications
-        ms.fs.unit.particle_dens_app.fix(722)
-        ms.fs.unit.particle_dia.fix(0.00106)
-        # adsorber bed specifications
-        ms.fs.unit.ebct.fix(300)  # seconds
-        ms.fs.unit.bed_voidage.fix(0.449)
-        ms.fs.unit.bed_length.fix(6)  # assumed
-        # design spec
-        ms.fs.unit.conc_ratio_replace.fix(0.50)
-        # parameters
-        ms.fs.unit.kf.fix(3.29e-5)
-        ms.fs.unit.ds.fix(1.77e-13)
-        ms.fs.unit.a0.fix(3.68421)
-        ms.fs.unit.a1.fix(13.1579)
-        ms.fs.unit.b0.fix(0.784576)
-        ms.fs.unit.b1.fix(0.239663)
-        ms.fs.unit.b2.fix(0.484422)
-        ms.fs.unit.b3.fix(0.003206)
-        ms.fs.unit.b4.fix(0.134987)
-
-        return ms
 
-    @pytest.mark.unit
-    def test_simplified_config(self, gac_frame_simplified):
-        ms = gac_frame_simplified
-        # check unit config arguments
-        assert len(ms.fs.unit.config) == 12
+def _unscaled_var_names(m):
+    # names of every var without a scaling factor, for assertion messages
+    return [v.name for v in unscaled_variables_generator(m)]
 
-        assert not ms.fs.unit.config.dynamic
-        assert not ms.fs.unit.config.has_holdup
-        assert ms.fs.unit.config.material_balance_type == MaterialBalanceType.useDefault
-        assert ms.fs.unit.config.energy_balance_type == EnergyBalanceType.none
-        assert (
-            ms.fs.unit.config.momentum_balance_type == MomentumBalanceType.pressureTotal
-        )
-        assert (
-            ms.fs.unit.config.film_transfer_coefficient_type
-            == FilmTransferCoefficientType.fixed
-        )
-        assert (
-            ms.fs.unit.config.surface_diffusion_coefficient_type
-            == SurfaceDiffusionCoefficientType.fixed
+
+def _empty_flowsheet():
+    # steady state flowsheet on a new ConcreteModel
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(dynamic=False)
+    return m
+
+
+def _apply_fixed(unit, fixed):
+    # fix unit model variables from a {name: value} mapping
+    for name, val in fixed.items():
+        getattr(unit, name).fix(val)
+
+
+def _attach_costing(fs, contactor_type=None):
+    # WaterTAP flowsheet costing in USD_2020 with GAC unit costing on fs.unit;
+    # imported here so tests without costing do not load the costing package
+    from watertap.costing import WaterTAPCosting
+
+    fs.costing = WaterTAPCosting()
+    fs.costing.base_currency = pyo.units.USD_2020
+
+    if contactor_type is None:
+        fs.unit.costing = UnitModelCostingBlock(flowsheet_costing_block=fs.costing)
+    else:
+        fs.unit.costing = UnitModelCostingBlock(
+            flowsheet_costing_block=fs.costing,
+            costing_method_arguments={"contactor_type": contactor_type},
         )
-        assert ms.fs.unit.config.finite_elements_ss_approximation == 5
 
-        # check properties
-        assert ms.fs.unit.config.property_package is ms.fs.properties
-        assert ms.fs.unit.config.property_package is ms.fs.properties
-        assert len(ms.fs.unit.config.property_package.solute_set) == 1
-        assert len(ms.fs.unit.config.property_package.solvent_set) == 1
-        assert ms.fs.properties.config.diffus_calculation == DiffusivityCalculation.none
 
+# -----------------------------------------------------------------------------
+# trial problem from Hand, 1984 for removal of trace DCE
+simplified_fixed = {
+    # adsorption isotherm
+    "freund_k": 37.9e-6 * (1e6**0.8316),
+    "freund_ninv": 0.8316,
+    # gac particle specifications
+    "particle_dens_app": 722,
+    "particle_dia": 0.00106,
+    # adsorber bed specifications
+    "ebct": 300,  # seconds
+    "bed_voidage": 0.449,
+    "bed_length": 6,  # assumed
+    # design spec
+    "conc_ratio_replace": 0.50,
+    # parameters
+    "kf": 3.29e-5,
+    "ds": 1.77e-13,
+    "a0": 3.68421,
+    "a1": 13.1579,
+    "b0": 0.784576,
+    "b1": 0.239663,
+    "b2": 0.484422,
+    "b3": 0.003206,
+    "b4": 0.134987,
+}
+
+
+@pytest.fixture(scope="module")
+def gac_frame_simplified():
+    ms = _empty_flowsheet()
+
+    ms.fs.properties = MCASParameterBlock(
+        solute_list=["DCE"],
+        mw_data={"H2O": 0.018, "DCE": 0.09896},
+    )
+    ms.fs.unit = GAC(
+        property_package=ms.fs.properties,
+        film_transfer_coefficient_type="fixed",
+        surface_diffusion_coefficient_type="fixed",
+    )
+
+    # feed specifications
+    feed = ms.fs.unit.process_flow.properties_in[0]
+    feed.pressure.fix(101325)  # feed pressure [Pa]
+    feed.temperature.fix(273.15 + 25)  # feed temperature [K]
+    feed.flow_mol_phase_comp["Liq", "H2O"].fix(55555.55426666667)
+    feed.flow_mol_phase_comp["Liq", "DCE"].fix(0.0002344381568310428)
+
+    _apply_fixed(ms.fs.unit, simplified_fixed)
+
+    return ms
+
+
+@pytest.fixture(scope="module")
+def scaled_simplified(gac_frame_simplified):
+    ms = gac_frame_simplified
+
+    ms.fs.properties.set_default_scaling(
+        "flow_mol_phase_comp", 1e-4, index=("Liq", "H2O")
+    )
+    ms.fs.properties.set_default_scaling(
+        "flow_mol_phase_comp", 1e4, index=("Liq", "DCE")
+    )
+    calculate_scaling_factors(ms)
+
+    return ms
+
+
+@pytest.fixture(scope="module")
+def initialized_simplified(scaled_simplified):
+    initialization_tester(scaled_simplified)
+    return scaled_simplified
+
+
+@pytest.fixture(scope="module")
+def simplified_results(initialized_simplified, solver):
+    # termination is checked in test_simplified_solve
+    return solver.solve(initialized_simplified)
+
+
+@pytest.fixture(scope="module")
+def solved_simplified(initialized_simplified, simplified_results):
+    return initialized_simplified
+
+
+class TestGACSimplified:
     @pytest.mark.unit
     def test_simplified_build(self, gac_frame_simplified):
         ms = gac_frame_simplified
@@ -174,168 +235,166 @@ class TestGACSimplified:
         assert degrees_of_freedom(ms) == 0
 
     @pytest.mark.unit
-    def test_simplified_calculate_scaling(self, gac_frame_simplified):
-        ms = gac_frame_simplified
-
-        ms.fs.properties.set_default_scaling(
-            "flow_mol_phase_comp", 1e-4, index=("Liq", "H2O")
-        )
-        ms.fs.properties.set_default_scaling(
-            "flow_mol_phase_comp", 1e4, index=("Liq", "DCE")
-        )
-        calculate_scaling_factors(ms)
+    def test_simplified_calculate_scaling(self, scaled_simplified):
+        ms = scaled_simplified
 
         # check that all variables have scaling factors
-        unscaled_var_list = list(unscaled_variables_generator(ms))
-        assert len(unscaled_var_list) == 0
+        unscaled = next(unscaled_variables_generator(ms), None)
+        assert unscaled is None, _unscaled_var_names(ms)
 
     @pytest.mark.component
-    def test_simplified_initialize(self, gac_frame_simplified):
-        initialization_tester(gac_frame_simplified)
+    def test_simplified_initialize(self, initialized_simplified):
+        # initialization_tester is run by initialized_simplified
+        assert degrees_of_freedom(initialized_simplified) == 0
 
     @pytest.mark.component
-    def test_simplified_var_scaling_init(self, gac_frame_simplified):
-        ms = gac_frame_simplified
-        badly_scaled_var_lst = list(
-            badly_scaled_var_generator(ms, large=sv_large, small=sv_small, zero=sv_zero)
-        )
-        print([(x[0].name, x[1]) for x in badly_scaled_var_lst])
-        assert badly_scaled_var_lst == []
+    def test_simplified_var_scaling_init(self, initialized_simplified):
+        ms = initialized_simplified
+        bad = _first_badly_scaled_var(ms)
+        assert bad is None, _badly_scaled_var_list(ms)
 
     @pytest.mark.component
-    def test_simplified_solve(self, gac_frame_simplified):
-        ms = gac_frame_simplified
-        results = solver.solve(ms)
-
+    def test_simplified_solve(self, simplified_results):
         # Check for optimal solution
-        assert check_optimal_termination(results)
+        assert check_optimal_termination(simplified_results)
 
     @pytest.mark.component
-    def test_simplified_var_scaling_solve(self, gac_frame_simplified):
-        ms = gac_frame_simplified
-        badly_scaled_var_lst = list(
-            badly_scaled_var_generator(ms, large=sv_large, small=sv_small, zero=sv_zero)
-        )
-        assert badly_scaled_var_lst == []
+    def test_simplified_var_scaling_solve(self, solved_simplified):
+        ms = solved_simplified
+        bad = _first_badly_scaled_var(ms)
+        assert bad is None, _badly_scaled_var_list(ms)
 
     @pytest.mark.component
-    def test_simplified_solution(self, gac_frame_simplified):
-        ms = gac_frame_simplified
+    def test_simplified_solution(self, solved_simplified):
+        ms = solved_simplified
 
         # Approx data pulled from graph in Hand, 1984 at ~30 days
         # 30 days adjusted to actual solution to account for web plot data extraction error within reason
         # values calculated by hand and match those reported in Hand, 1984
-        assert pytest.approx(0.0005178, rel=1e-3) == value(ms.fs.unit.equil_conc)
-        assert pytest.approx(19780, rel=1e-3) == value(ms.fs.unit.dg)
-        assert pytest.approx(6.113, rel=1e-3) == value(ms.fs.unit.N_Bi)
-        assert pytest.approx(35.68, rel=1e-3) == value(ms.fs.unit.min_N_St)
-        assert pytest.approx(0.9882, rel=1e-3) == value(ms.fs.unit.throughput)
-        assert pytest.approx(468.4, rel=1e-3) == value(ms.fs.unit.min_residence_time)
-        assert pytest.approx(134.7, rel=1e-3) == value(ms.fs.unit.residence_time)
-        assert pytest.approx(9153000, rel=1e-3) == value(
-            ms.fs.unit.min_operational_time
-        )
-        assert pytest.approx(2554000, rel=1e-3) == value(ms.fs.unit.operational_time)
-        assert pytest.approx(8514, rel=1e-3) == value(ms.fs.unit.bed_volumes_treated)
+        expected = {
+            "equil_conc": 0.0005178,
+            "dg": 19780,
+            "N_Bi": 6.113,
+            "min_N_St": 35.68,
+            "throughput": 0.9882,
+            "min_residence_time": 468.4,
+            "residence_time": 134.7,
+            "min_operational_time": 9153000,
+            "operational_time": 2554000,
+            "bed_volumes_treated": 8514,
+        }
+        actual = {k: value(ms.fs.unit.find_component(k)) for k in expected}
+        assert actual == pytest.approx(expected, rel=1e-3)
 
 
 # -----------------------------------------------------------------------------
-class TestGACRobust:
-    @pytest.fixture(scope="class")
-    def gac_frame_robust(self):
-        mr = ConcreteModel()
-        mr.fs = FlowsheetBlock(dynamic=False)
-
-        mr.fs.properties = MCASParameterBlock(
-            solute_list=["TCE"],
-            mw_data={"H2O": 0.018, "TCE": 0.1314},
-            diffus_calculation=DiffusivityCalculation.HaydukLaudie,
-            molar_volume_data={("Liq", "TCE"): 9.81e-5},
-        )
-        mr.fs.properties.visc_d_phase["Liq"] = 1.3097e-3
-        mr.fs.properties.dens_mass_const = 999.7
-        mr.fs.unit = GAC(
-            property_package=mr.fs.properties,
-            film_transfer_coefficient_type="fixed",
-            surface_diffusion_coefficient_type="fixed",
-            finite_elements_ss_approximation=9,
-        )
-
-        # feed specifications
-        mr.fs.unit.process_flow.properties_in[0].pressure.fix(
-            101325
-        )  # feed pressure [Pa]
-        mr.fs.unit.process_flow.properties_in[0].temperature.fix(
-            273.15 + 25
-        )  # feed temperature [K]
-        mr.fs.unit.process_flow.properties_in[0].flow_mol_phase_comp["Liq", "H2O"].fix(
-            823.8
-        )
-        mr.fs.unit.process_flow.properties_in[0].flow_mol_phase_comp["Liq", "TCE"].fix(
-            5.6444e-05
-        )
-
-        # trial problem from Crittenden, 2012 for removal of TCE
-        # adsorption isotherm
-        mr.fs.unit.freund_k.fix(1062e-6 * (1e6**0.48))
-        mr.fs.unit.freund_ninv.fix(0.48)
-        # gac particle specifications
-        mr.fs.unit.particle_dens_app.fix(803.4)
-        mr.fs.unit.particle_dia.fix(0.001026)
-        # adsorber bed specifications
-        mr.fs.unit.ebct.fix(10 * 60)
-        mr.fs.unit.bed_voidage.fix(0.44)
-        mr.fs.unit.velocity_sup.fix(5 / 3600)
-        # design spec
-        mr.fs.unit.conc_ratio_replace.fix(0.80)
-        # parameters
-        mr.fs.unit.ds.fix(1.24e-14)
-        mr.fs.unit.kf.fix(3.73e-05)
-        mr.fs.unit.a0.fix(0.8)
-        mr.fs.unit.a1.fix(0)
-        mr.fs.unit.b0.fix(0.023)
-        mr.fs.unit.b1.fix(0.793673)
-        mr.fs.unit.b2.fix(0.039324)
-        mr.fs.unit.b3.fix(0.009326)
-        mr.fs.unit.b4.fix(0.08275)
-
-        return mr
+# trial problem from Crittenden, 2012 for removal of TCE
+robust_fixed = {
+    # adsorption isotherm
+    "freund_k": 1062e-6 * (1e6**0.48),
+    "freund_ninv": 0.48,
+    # gac particle specifications
+    "particle_dens_app": 803.4,
+    "particle_dia": 0.001026,
+    # adsorber bed specifications
+    "ebct": 10 * 60,
+    "bed_voidage": 0.44,
+    "velocity_sup": 5 / 3600,
+    # design spec
+    "conc_ratio_replace": 0.80,
+    # parameters
+    "ds": 1.24e-14,
+    "kf": 3.73e-05,
+    "a0": 0.8,
+    "a1": 0,
+    "b0": 0.023,
+    "b1": 0.793673,
+    "b2": 0.039324,
+    "b3": 0.009326,
+    "b4": 0.08275,
+}
+
+
+def _build_robust(finite_elements):
+    mr = _empty_flowsheet()
+
+    mr.fs.properties = MCASParameterBlock(
+        solute_list=["TCE"],
+        mw_data={"H2O": 0.018, "TCE": 0.1314},
+        diffus_calculation=DiffusivityCalculation.HaydukLaudie,
+        molar_volume_data={("Liq", "TCE"): 9.81e-5},
+    )
+    mr.fs.properties.visc_d_phase["Liq"] = 1.3097e-3
+    mr.fs.properties.dens_mass_const = 999.7
+    mr.fs.unit = GAC(
+        property_package=mr.fs.properties,
+        film_transfer_coefficient_type="fixed",
+        surface_diffusion_coefficient_type="fixed",
+        finite_elements_ss_approximation=finite_elements,
+    )
+
+    # feed specifications
+    feed = mr.fs.unit.process_flow.properties_in[0]
+    feed.pressure.fix(101325)  # feed pressure [Pa]
+    feed.temperature.fix(273.15 + 25)  # feed temperature [K]
+    feed.flow_mol_phase_comp["Liq", "H2O"].fix(823.8)
+    feed.flow_mol_phase_comp["Liq", "TCE"].fix(5.6444e-05)
+
+    _apply_fixed(mr.fs.unit, robust_fixed)
+
+    return mr
+
+
+def _scale_robust(mr):
+    mr.fs.properties.set_default_scaling(
+        "flow_mol_phase_comp", 1e-2, index=("Liq", "H2O")
+    )
+    mr.fs.properties.set_default_scaling(
+        "flow_mol_phase_comp", 1e5, index=("Liq", "TCE")
+    )
+    calculate_scaling_factors(mr)
+
+
+@pytest.fixture(scope="module")
+def gac_frame_robust():
+    return _build_robust(finite_elements=9)
+
+
+# coarser discretization of the robust frame for the structural unit tests,
+# which do not depend on the accuracy of the steady state approximation
+@pytest.fixture(scope="module")
+def gac_frame_robust_fast():
+    return _build_robust(finite_elements=5)
+
+
+@pytest.fixture(scope="module")
+def scaled_robust(gac_frame_robust):
+    _scale_robust(gac_frame_robust)
+    return gac_frame_robust
+
+
+@pytest.fixture(scope="module")
+def initialized_robust(scaled_robust):
+    # the 9 element frame is initialized once, here, for every later robust test
+    initialization_tester(scaled_robust)
+    return scaled_robust
+
+
+@pytest.fixture(scope="module")
+def robust_results(initialized_robust, solver):
+    # termination is checked in test_robust_solve
+    return solver.solve(initialized_robust)
+
+
+@pytest.fixture(scope="module")
+def solved_robust(initialized_robust, robust_results):
+    return initialized_robust
 
-    @pytest.mark.unit
-    def test_robust_config(self, gac_frame_robust):
-        mr = gac_frame_robust
-        # check unit config arguments
-        assert len(mr.fs.unit.config) == 12
-
-        assert not mr.fs.unit.config.dynamic
-        assert not mr.fs.unit.config.has_holdup
-        assert mr.fs.unit.config.material_balance_type == MaterialBalanceType.useDefault
-        assert mr.fs.unit.config.energy_balance_type == EnergyBalanceType.none
-        assert (
-            mr.fs.unit.config.momentum_balance_type == MomentumBalanceType.pressureTotal
-        )
-        assert (
-            mr.fs.unit.config.film_transfer_coefficient_type
-            == FilmTransferCoefficientType.fixed
-        )
-        assert (
-            mr.fs.unit.config.surface_diffusion_coefficient_type
-            == SurfaceDiffusionCoefficientType.fixed
-        )
-        assert mr.fs.unit.config.finite_elements_ss_approximation == 9
-
-        # check properties
-        assert mr.fs.unit.config.property_package is mr.fs.properties
-        assert len(mr.fs.unit.config.property_package.solute_set) == 1
-        assert len(mr.fs.unit.config.property_package.solvent_set) == 1
-        assert (
-            mr.fs.properties.config.diffus_calculation
-            == DiffusivityCalculation.HaydukLaudie
-        )
 
+class TestGACRobust:
     @pytest.mark.unit
-    def test_robust_build(self, gac_frame_robust):
-        mr = gac_frame_robust
+    def test_robust_build(self, gac_frame_robust_fast):
+        mr = gac_frame_robust_fast
 
         # test units
         assert assert_units_consistent(mr) is None
@@ -348,102 +407,89 @@ class TestGACRobust:
             assert isinstance(port, Port)
 
         # test statistics
-        assert number_variables(mr) == 119
-        assert number_total_constraints(mr) == 84
+        assert number_variables(mr) == 99
+        assert number_total_constraints(mr) == 64
         assert number_unused_variables(mr) == 10  # dens parameters from properties
 
     @pytest.mark.unit
-    def test_robust_dof(self, gac_frame_robust):
-        mr = gac_frame_robust
+    def test_robust_dof(self, gac_frame_robust_fast):
+        mr = gac_frame_robust_fast
         assert degrees_of_freedom(mr) == 0
 
     @pytest.mark.unit
-    def test_robust_calculate_scaling(self, gac_frame_robust):
-        mr = gac_frame_robust
-
-        mr.fs.properties.set_default_scaling(
-            "flow_mol_phase_comp", 1e-2, index=("Liq", "H2O")
-        )
-        mr.fs.properties.set_default_scaling(
-            "flow_mol_phase_comp", 1e5, index=("Liq", "TCE")
-        )
-        calculate_scaling_factors(mr)
+    def test_robust_calculate_scaling(self, gac_frame_robust_fast):
+        mr = gac_frame_robust_fast
+        _scale_robust(mr)
 
         # check that all variables have scaling factors
-        unscaled_var_list = list(unscaled_variables_generator(mr))
-        assert len(unscaled_var_list) == 0
+        unscaled = next(unscaled_variables_generator(mr), None)
+        assert unscaled is None, _unscaled_var_names(mr)
 
     @pytest.mark.component
-    def test_robust_initialize(self, gac_frame_robust):
-        initialization_tester(gac_frame_robust)
+    def test_robust_initialize(self, initialized_robust):
+        # initialization_tester is run by initialized_robust
+        assert degrees_of_freedom(initialized_robust) == 0
 
     @pytest.mark.component
-    def test_robust_var_scaling_init(self, gac_frame_robust):
-        mr = gac_frame_robust
-        badly_scaled_var_lst = list(
-            badly_scaled_var_generator(mr, large=sv_large, small=sv_small, zero=sv_zero)
-        )
-        assert badly_scaled_var_lst == []
+    def test_robust_var_scaling_init(self, initialized_robust):
+        mr = initialized_robust
+        # the 9 element reference frame is not covered by the unit tier scaling check
+        unscaled = next(unscaled_variables_generator(mr), None)
+        assert unscaled is None, _unscaled_var_names(mr)
+        bad = _first_badly_scaled_var(mr)
+        assert bad is None, _badly_scaled_var_list(mr)
 
     @pytest.mark.component
-    def test_robust_solve(self, gac_frame_robust):
-        mr = gac_frame_robust
-        results = solver.solve(mr)
-
+    def test_robust_solve(self, robust_results):
         # Check for optimal solution
-        assert check_optimal_termination(results)
+        assert check_optimal_termination(robust_results)
 
     @pytest.mark.component
-    def test_robust_var_scaling_solve(self, gac_frame_robust):
-        mr = gac_frame_robust
-        badly_scaled_var_lst = list(
-            badly_scaled_var_generator(mr, large=sv_large, small=sv_small, zero=sv_zero)
-        )
-        assert badly_scaled_var_lst == []
+    def test_robust_var_scaling_solve(self, solved_robust):
+        mr = solved_robust
+        bad = _first_badly_scaled_var(mr)
+        assert bad is None, _badly_scaled_var_list(mr)
 
     @pytest.mark.component
-    def test_robust_solution(self, gac_frame_robust):
-        mr = gac_frame_robust
+    def test_robust_solution(self, solved_robust):
+        mr = solved_robust
 
         # values calculated by hand and match those reported in Crittenden, 2012
-        assert pytest.approx(0.02097, rel=1e-3) == value(mr.fs.unit.equil_conc)
-        assert pytest.approx(42890, rel=1e-3) == value(mr.fs.unit.dg)
-        assert pytest.approx(45.79, rel=1e-3) == value(mr.fs.unit.N_Bi)
-        assert pytest.approx(36.64, rel=1e-3) == value(mr.fs.unit.min_N_St)
-        assert pytest.approx(1.139, rel=1e-3) == value(mr.fs.unit.throughput)
-        assert pytest.approx(395.9, rel=1e-3) == value(mr.fs.unit.min_residence_time)
-        assert pytest.approx(264.0, rel=1e-3) == value(mr.fs.unit.residence_time)
-        assert pytest.approx(19340000, rel=1e-3) == value(
-            mr.fs.unit.min_operational_time
-        )
-        assert pytest.approx(13690000, rel=1e-3) == value(mr.fs.unit.operational_time)
-        assert pytest.approx(22810, rel=1e-3) == value(mr.fs.unit.bed_volumes_treated)
-        assert pytest.approx(0.003157, rel=1e-3) == value(mr.fs.unit.velocity_int)
-        assert pytest.approx(0.8333, rel=1e-3) == value(mr.fs.unit.bed_length)
-        assert pytest.approx(10.68, rel=1e-3) == value(mr.fs.unit.bed_area)
-        assert pytest.approx(8.900, rel=1e-3) == value(mr.fs.unit.bed_volume)
-        assert pytest.approx(3.688, rel=1e-3) == value(mr.fs.unit.bed_diameter)
-        assert pytest.approx(4004, rel=1e-3) == value(mr.fs.unit.bed_mass_gac)
-        assert pytest.approx(6462000, rel=1e-3) == value(
-            mr.fs.unit.ele_operational_time[1]
-        )
-        assert pytest.approx(0.2287, rel=1e-3) == value(mr.fs.unit.conc_ratio_avg)
+        expected = {
+            "equil_conc": 0.02097,
+            "dg": 42890,
+            "N_Bi": 45.79,
+            "min_N_St": 36.64,
+            "throughput": 1.139,
+            "min_residence_time": 395.9,
+            "residence_time": 264.0,
+            "min_operational_time": 19340000,
+            "operational_time": 13690000,
+            "bed_volumes_treated": 22810,
+            "velocity_int": 0.003157,
+            "bed_length": 0.8333,
+            "bed_area": 10.68,
+            "bed_volume": 8.900,
+            "bed_diameter": 3.688,
+            "bed_mass_gac": 4004,
+            "ele_operational_time[1]": 6462000,
+            "conc_ratio_avg": 0.2287,
+        }
+        actual = {k: value(mr.fs.unit.find_component(k)) for k in expected}
+        assert actual == pytest.approx(expected, rel=1e-3)
 
     @pytest.mark.component
-    def test_robust_reporting(self, gac_frame_robust):
-        mr = gac_frame_robust
-        mr.fs.unit.report()
+    def test_robust_reporting(self, solved_robust):
+        mr = solved_robust
+        stream = StringIO()
+        mr.fs.unit.report(ostream=stream)
+        assert stream.tell() > 0
 
     @pytest.mark.component
-    def test_robust_costing_pressure(self, gac_frame_robust):
-        mr = gac_frame_robust
+    def test_robust_costing_pressure(self, solved_robust, solver):
+        mr = solved_robust.clone()
 
-        mr.fs.costing = WaterTAPCosting()
-        mr.fs.costing.base_currency = pyo.units.USD_2020
-
-        mr.fs.unit.costing = UnitModelCostingBlock(
-            flowsheet_costing_block=mr.fs.costing
-        )
+        _attach_costing(mr.fs)
 
         # testing gac costing block dof and initialization
         assert degrees_of_freedom(mr) == 0
@@ -485,16 +531,10 @@ class TestGACRobust:
         )
 
     @pytest.mark.component
-    def test_robust_costing_gravity(self, gac_frame_robust):
-        mr_grav = gac_frame_robust.clone()
+    def test_robust_costing_gravity(self, solved_robust, solver):
+        mr_grav = solved_robust.clone()
 
-        mr_grav.fs.costing = WaterTAPCosting()
-        mr_grav.fs.costing.base_currency = pyo.units.USD_2020
-
-        mr_grav.fs.unit.costing = UnitModelCostingBlock(
-            flowsheet_costing_block=mr_grav.fs.costing,
-            costing_method_arguments={"contactor_type": "gravity"},
-        )
+        _attach_costing(mr_grav.fs, contactor_type="gravity")
         mr_grav.fs.costing.cost_process()
         results = solver.solve(mr_grav)
 
@@ -533,15 +573,10 @@ class TestGACRobust:
         )
 
     @pytest.mark.component
-    def test_robust_costing_modular_contactors(self, gac_frame_robust):
-        mr = gac_frame_robust
+    def test_robust_costing_modular_contactors(self, solved_robust, solver):
+        mr = solved_robust.clone()
 
-        mr.fs.costing = WaterTAPCosting()
-        mr.fs.costing.base_currency = pyo.units.USD_2020
-
-        mr.fs.unit.costing = UnitModelCostingBlock(
-            flowsheet_costing_block=mr.fs.costing
-        )
+        _attach_costing(mr.fs)
         mr.fs.costing.cost_process()
 
         mr.fs.costing.gac.num_contactors_op.fix(4)
@@ -561,23 +596,17 @@ class TestGACRobust:
         assert pytest.approx(176200, rel=1e-3) == value(mr.fs.unit.costing.capital_cost)
 
     @pytest.mark.component
-    def test_robust_costing_max_gac_ref(self, gac_frame_robust):
-        mr = gac_frame_robust
+    def test_robust_costing_max_gac_ref(self, solved_robust, solver):
+        # the clone keeps the solved base point, so the 10x flow case is solved
+        # starting from the converged robust solution rather than a cold start
+        mr = solved_robust.clone()
 
         # scale flow up 10x
-        mr.fs.unit.process_flow.properties_in[0].flow_mol_phase_comp["Liq", "H2O"].fix(
-            10 * 824.0736620370348
-        )
-        mr.fs.unit.process_flow.properties_in[0].flow_mol_phase_comp["Liq", "TCE"].fix(
-            10 * 5.644342973110135e-05
-        )
-
-        mr.fs.costing = WaterTAPCosting()
-        mr.fs.costing.base_currency = pyo.units.USD_2020
+        flow_in = mr.fs.unit.process_flow.properties_in[0].flow_mol_phase_comp
+        flow_in["Liq", "H2O"].fix(10 * 824.0736620370348)
+        flow_in["Liq", "TCE"].fix(10 * 5.644342973110135e-05)
 
-        mr.fs.unit.costing = UnitModelCostingBlock(
-            flowsheet_costing_block=mr.fs.costing
-        )
+        _attach_costing(mr.fs)
         mr.fs.costing.cost_process()
         # not necessarily an optimum solution because poor scaling but just checking the conditional
         results = solver.solve(mr)
@@ -592,322 +621,336 @@ class TestGACRobust:
 
 
 # -----------------------------------------------------------------------------
-class TestGACMulti:
-    @pytest.fixture(scope="class")
-    def gac_frame_multi(self):
-        mm = ConcreteModel()
-        mm.fs = FlowsheetBlock(dynamic=False)
-
-        # inserting arbitrary BackGround Solutes, Cations, and Anions to check handling
-        # arbitrary diffusivity data for non-target species
-        mm.fs.properties = MCASParameterBlock(
-            solute_list=["TCE", "BGSOL", "BGCAT", "BGAN"],
-            mw_data={
-                "H2O": 0.018,
-                "TCE": 0.1314,
-                "BGSOL": 0.1,
-                "BGCAT": 0.1,
-                "BGAN": 0.1,
-            },
-            charge={"BGCAT": 1, "BGAN": -2},
-            diffus_calculation=DiffusivityCalculation.HaydukLaudie,
-            molar_volume_data={("Liq", "TCE"): 9.81e-5},
-            diffusivity_data={
-                ("Liq", "BGSOL"): 1e-5,
-                ("Liq", "BGCAT"): 1e-5,
-                ("Liq", "BGAN"): 1e-5,
-            },
-        )
-        mm.fs.properties.visc_d_phase["Liq"] = 1.3097e-3
-        mm.fs.properties.dens_mass_const = 1000
-        # testing target_species arg
-        mm.fs.unit = GAC(
-            property_package=mm.fs.properties,
-            film_transfer_coefficient_type="calculated",
-            surface_diffusion_coefficient_type="calculated",
-            target_species={"TCE"},
-        )
+@pytest.mark.parametrize(
+    "frame, diffus_calculation",
+    [
+        ("gac_frame_simplified", DiffusivityCalculation.none),
+        ("gac_frame_robust_fast", DiffusivityCalculation.HaydukLaudie),
+    ],
+    ids=["simplified", "robust"],
+)
+@pytest.mark.unit
+def test_config(request, frame, diffus_calculation):
+    m = request.getfixturevalue(frame)
+    cfg = dict(m.fs.unit.config.items())
+    # check unit config arguments
+    assert len(cfg) == 12
+
+    assert not cfg["dynamic"]
+    assert not cfg["has_holdup"]
+    assert cfg["material_balance_type"] == MaterialBalanceType.useDefault
+    assert cfg["energy_balance_type"] == EnergyBalanceType.none
+    assert cfg["momentum_balance_type"] == MomentumBalanceType.pressureTotal
+    assert cfg["film_transfer_coefficient_type"] == FilmTransferCoefficientType.fixed
+    assert (
+        cfg["surface_diffusion_coefficient_type"]
+        == SurfaceDiffusionCoefficientType.fixed
+    )
+    assert cfg["finite_elements_ss_approximation"] == 5
+
+    # check properties
+    assert cfg["property_package"] is m.fs.properties
+    assert len(cfg["property_package"].solute_set) == 1
+    assert len(cfg["property_package"].solvent_set) == 1
+    assert m.fs.properties.config.diffus_calculation == diffus_calculation
 
-        # feed specifications
-        mm.fs.unit.process_flow.properties_in[0].pressure.fix(
-            101325
-        )  # feed pressure [Pa]
-        mm.fs.unit.process_flow.properties_in[0].temperature.fix(
-            273.15 + 25
-        )  # feed temperature [K]
-        mm.fs.unit.process_flow.properties_in[0].flow_mol_phase_comp["Liq", "H2O"].fix(
-            824.0736620370348
-        )
-        mm.fs.unit.process_flow.properties_in[0].flow_mol_phase_comp["Liq", "TCE"].fix(
-            5.644342973110135e-05
-        )
-        mm.fs.unit.process_flow.properties_in[0].flow_mol_phase_comp[
-            "Liq", "BGSOL"
-        ].fix(5e-05)
-        mm.fs.unit.process_flow.properties_in[0].flow_mol_phase_comp[
-            "Liq", "BGCAT"
-        ].fix(2e-05)
-        mm.fs.unit.process_flow.properties_in[0].flow_mol_phase_comp["Liq", "BGAN"].fix(
-            1e-05
+
+# -----------------------------------------------------------------------------
+# trial problem from Crittenden, 2012 for removal of TCE
+multi_fixed = {
+    # adsorption isotherm
+    "freund_k": 1062e-6 * (1e6**0.48),
+    "freund_ninv": 0.48,
+    # gac particle specifications
+    "particle_dens_app": 803.4,
+    "particle_dia": 0.001026,
+    # adsorber bed specifications
+    "ebct": 10 * 60,
+    "bed_voidage": 0.44,
+    "velocity_sup": 5 / 3600,
+    # design spec
+    "conc_ratio_replace": 0.80,
+    # parameters
+    "particle_porosity": 0.641,
+    "tort": 1,
+    "spdfr": 1,
+    "shape_correction_factor": 1.5,
+    "a0": 0.8,
+    "a1": 0,
+    "b0": 0.023,
+    "b1": 0.793673,
+    "b2": 0.039324,
+    "b3": 0.009326,
+    "b4": 0.08275,
+}
+
+
+# inserting arbitrary BackGround Solutes, Cations, and Anions to check handling
+# arbitrary diffusivity data for non-target species
+bg_solutes = ("TCE", "BGSOL", "BGCAT", "BGAN")
+bg_mw_data = {"H2O": 0.018, "TCE": 0.1314, "BGSOL": 0.1, "BGCAT": 0.1, "BGAN": 0.1}
+bg_charge = {"BGCAT": 1, "BGAN": -2}
+bg_diffusivity_data = {
+    ("Liq", "BGSOL"): 1e-5,
+    ("Liq", "BGCAT"): 1e-5,
+    ("Liq", "BGAN"): 1e-5,
+}
+tce_molar_volume_data = {("Liq", "TCE"): 9.81e-5}
+
+
+@pytest.fixture(scope="module")
+def gac_frame_multi():
+    mm = _empty_flowsheet()
+
+    mm.fs.properties = MCASParameterBlock(
+        solute_list=bg_solutes,
+        mw_data=bg_mw_data,
+        charge=bg_charge,
+        diffus_calculation=DiffusivityCalculation.HaydukLaudie,
+        molar_volume_data=tce_molar_volume_data,
+        diffusivity_data=bg_diffusivity_data,
+    )
+    mm.fs.properties.visc_d_phase["Liq"] = 1.3097e-3
+    mm.fs.properties.dens_mass_const = 1000
+    # testing target_species arg
+    mm.fs.unit = GAC(
+        property_package=mm.fs.properties,
+        film_transfer_coefficient_type="calculated",
+        surface_diffusion_coefficient_type="calculated",
+        target_species={"TCE"},
+    )
+
+    # feed specifications
+    feed = mm.fs.unit.process_flow.properties_in[0]
+    feed.pressure.fix(101325)  # feed pressure [Pa]
+    feed.temperature.fix(273.15 + 25)  # feed temperature [K]
+    feed.flow_mol_phase_comp["Liq", "H2O"].fix(824.0736620370348)
+    feed.flow_mol_phase_comp["Liq", "TCE"].fix(5.644342973110135e-05)
+    feed.flow_mol_phase_comp["Liq", "BGSOL"].fix(5e-05)
+    feed.flow_mol_phase_comp["Liq", "BGCAT"].fix(2e-05)
+    feed.flow_mol_phase_comp["Liq", "BGAN"].fix(1e-05)
+
+    _apply_fixed(mm.fs.unit, multi_fixed)
+
+    return mm
+
+
+@pytest.fixture(scope="module")
+def scaled_multi(gac_frame_multi):
+    mm = gac_frame_multi
+
+    mm.fs.properties.set_default_scaling(
+        "flow_mol_phase_comp", 1e-2, index=("Liq", "H2O")
+    )
+    for j in mm.fs.properties.ion_set | mm.fs.properties.solute_set:
+        mm.fs.properties.set_default_scaling(
+            "flow_mol_phase_comp", 1e5, index=("Liq", j)
         )
+    calculate_scaling_factors(mm)
+
+    return mm
+
+
+@pytest.fixture(scope="module")
+def initialized_multi(scaled_multi):
+    initialization_tester(scaled_multi)
+    return scaled_multi
+
+
+@pytest.fixture(scope="module")
+def multi_results(initialized_multi, solver):
+    # termination is checked in test_multi_solve
+    return solver.solve(initialized_multi)
+
 
-        # trial problem from Crittenden, 2012 for removal of TCE
-        # adsorption isotherm
-        mm.fs.unit.freund_k.fix(1062e-6 * (1e6**0.48))
-        mm.fs.unit.freund_ninv.fix(0.48)
-        # gac particle specifications
-        mm.fs.unit.particle_dens_app.fix(803.4)
-        mm.fs.unit.particle_dia.fix(0.001026)
-        # adsorber bed specifications
-        mm.fs.unit.ebct.fix(10 * 60)
-        mm.fs.unit.bed_voidage.fix(0.44)
-        mm.fs.unit.velocity_sup.fix(5 / 3600)
-        # design spec
-        mm.fs.unit.conc_ratio_replace.fix(0.80)
-        # parameters
-        mm.fs.unit.particle_porosity.fix(0.641)
-        mm.fs.unit.tort.fix(1)
-        mm.fs.unit.spdfr.fix(1)
-        mm.fs.unit.shape_correction_factor.fix(1.5)
-        mm.fs.unit.a0.fix(0.8)
-        mm.fs.unit.a1.fix(0)
-        mm.fs.unit.b0.fix(0.023)
-        mm.fs.unit.b1.fix(0.793673)
-        mm.fs.unit.b2.fix(0.039324)
-        mm.fs.unit.b3.fix(0.009326)
-        mm.fs.unit.b4.fix(0.08275)
-
-        return mm
+@pytest.fixture(scope="module")
+def solved_multi(initialized_multi, multi_results):
+    return initialized_multi
 
+
+class TestGACMulti:
     @pytest.mark.unit
     def test_multi_config(self, gac_frame_multi):
         mm = gac_frame_multi
+        cfg = dict(mm.fs.unit.config.items())
 
         # checking non-unity solute set and nonzero ion set handling
-        assert len(mm.fs.unit.config.property_package.solute_set) == 4
-        assert len(mm.fs.unit.config.property_package.solvent_set) == 1
-        assert len(mm.fs.unit.config.property_package.ion_set) == 2
+        assert len(cfg["property_package"].solute_set) == 4
+        assert len(cfg["property_package"].solvent_set) == 1
+        assert len(cfg["property_package"].ion_set) == 2
         assert (
             mm.fs.properties.config.diffus_calculation
             == DiffusivityCalculation.HaydukLaudie
         )
         assert (
-            mm.fs.unit.config.film_transfer_coefficient_type
+            cfg["film_transfer_coefficient_type"]
             == FilmTransferCoefficientType.calculated
         )
         assert (
-            mm.fs.unit.config.surface_diffusion_coefficient_type
+            cfg["surface_diffusion_coefficient_type"]
             == SurfaceDiffusionCoefficientType.calculated
         )
 
         assert degrees_of_freedom(mm) == 0
 
     @pytest.mark.unit
-    def test_multi_calculate_scaling(self, gac_frame_multi):
-        mm = gac_frame_multi
-
-        mm.fs.properties.set_default_scaling(
-            "flow_mol_phase_comp", 1e-2, index=("Liq", "H2O")
-        )
-        for j in mm.fs.properties.ion_set | mm.fs.properties.solute_set:
-            mm.fs.properties.set_default_scaling(
-                "flow_mol_phase_comp", 1e5, index=("Liq", j)
-            )
-
-        calculate_scaling_factors(mm)
-        initialization_tester(gac_frame_multi)
+    def test_multi_calculate_scaling(self, scaled_multi):
+        mm = scaled_multi
 
         # check that all variables have scaling factors
-        unscaled_var_list = list(unscaled_variables_generator(mm))
-        assert len(unscaled_var_list) == 0
+        unscaled = next(unscaled_variables_generator(mm), None)
+        assert unscaled is None, _unscaled_var_names(mm)
 
-    @pytest.mark.unit
-    def test_multi_var_scaling_init(self, gac_frame_multi):
-        mm = gac_frame_multi
-        badly_scaled_var_lst = list(
-            badly_scaled_var_generator(mm, large=sv_large, small=sv_small, zero=sv_zero)
-        )
-        assert badly_scaled_var_lst == []
+    @pytest.mark.component
+    def test_multi_initialize(self, initialized_multi):
+        # initialization_tester is run by initialized_multi
+        assert degrees_of_freedom(initialized_multi) == 0
 
     @pytest.mark.component
-    def test_multi_solve(self, gac_frame_multi):
-        mm = gac_frame_multi
-        results = solver.solve(mm)
+    def test_multi_var_scaling_init(self, initialized_multi):
+        mm = initialized_multi
+        bad = _first_badly_scaled_var(mm)
+        assert bad is None, _badly_scaled_var_list(mm)
 
+    @pytest.mark.component
+    def test_multi_solve(self, multi_results):
         # Check for optimal solution
-        assert check_optimal_termination(results)
+        assert check_optimal_termination(multi_results)
 
-    @pytest.mark.unit
-    def test_multi_var_scaling_solve(self, gac_frame_multi):
-        mm = gac_frame_multi
-        badly_scaled_var_lst = list(
-            badly_scaled_var_generator(mm, large=sv_large, small=sv_small, zero=sv_zero)
-        )
-        assert badly_scaled_var_lst == []
+    @pytest.mark.component
+    def test_multi_var_scaling_solve(self, solved_multi):
+        mm = solved_multi
+        bad = _first_badly_scaled_var(mm)
+        assert bad is None, _badly_scaled_var_list(mm)
 
     @pytest.mark.component
-    def test_multi_solution(self, gac_frame_multi):
-        mm = gac_frame_multi
+    def test_multi_solution(self, solved_multi):
+        mm = solved_multi
 
         # only checking for variables new to configuration options
-        assert pytest.approx(2.473, rel=1e-3) == value(mm.fs.unit.N_Re)
-        assert pytest.approx(2001, rel=1e-3) == value(mm.fs.unit.N_Sc)
-        assert pytest.approx(2.600e-5, rel=1e-3) == value(mm.fs.unit.kf)
-        assert pytest.approx(1.245e-14, rel=1e-3) == value(mm.fs.unit.ds)
+        expected = {
+            "N_Re": 2.473,
+            "N_Sc": 2001,
+            "kf": 2.600e-5,
+            "ds": 1.245e-14,
+        }
+        actual = {k: value(mm.fs.unit.find_component(k)) for k in expected}
+        assert actual == pytest.approx(expected, rel=1e-3)
 
     @pytest.mark.component
-    def test_multi_reporting(self, gac_frame_multi):
-        mm = gac_frame_multi
-        mm.fs.unit.report()
+    def test_multi_reporting(self, scaled_multi):
+        mm = scaled_multi
+        stream = StringIO()
+        mm.fs.unit.report(ostream=stream)
+        assert stream.tell() > 0
 
 
 # -----------------------------------------------------------------------------
-class TestGACErrorLog:
-    @pytest.mark.unit
-    def test_error(self):
-
-        with pytest.raises(
-            ConfigurationError,
-            match="'target species' is not specified for the GAC unit model, "
-            "either specify 'target species' argument or reduce solute set "
-            "to a single component",
-        ):
-            me = ConcreteModel()
-            me.fs = FlowsheetBlock(dynamic=False)
-
-            # inserting arbitrary BackGround Solutes, Cations, and Anions to check handling
-            # arbitrary diffusivity data for non-target species
-            me.fs.properties = MCASParameterBlock(
-                solute_list=["TCE", "BGSOL", "BGCAT", "BGAN"],
-                mw_data={
-                    "H2O": 0.018,
-                    "TCE": 0.1314,
-                    "BGSOL": 0.1,
-                    "BGCAT": 0.1,
-                    "BGAN": 0.1,
-                },
-                charge={"BGCAT": 1, "BGAN": -2},
-                diffus_calculation=DiffusivityCalculation.HaydukLaudie,
-                molar_volume_data={("Liq", "TCE"): 9.81e-5},
-                diffusivity_data={
-                    ("Liq", "BGSOL"): 1e-5,
-                    ("Liq", "BGCAT"): 1e-5,
-                    ("Liq", "BGAN"): 1e-5,
-                },
-            )
-            me.fs.properties.visc_d_phase["Liq"] = 1.3097e-3
-            me.fs.properties.dens_mass_const = 1000
-
-            # testing target_species arg
-            me.fs.unit = GAC(
-                property_package=me.fs.properties,
-                film_transfer_coefficient_type="calculated",
-                surface_diffusion_coefficient_type="calculated",
-            )
-
-        with pytest.raises(
-            ConfigurationError,
-            match="fs.unit received invalid argument for contactor_type:"
-            " vessel. Argument must be a member of the ContactorType Enum.",
-        ):
-            me = ConcreteModel()
-            me.fs = FlowsheetBlock(dynamic=False)
-
-            me.fs.properties = MCASParameterBlock(
-                solute_list=["TCE"],
-                mw_data={"H2O": 0.018, "TCE": 0.1314},
-                diffus_calculation=DiffusivityCalculation.HaydukLaudie,
-                molar_volume_data={("Liq", "TCE"): 9.81e-5},
-            )
-            me.fs.properties.visc_d_phase["Liq"] = 1.3097e-3
-            me.fs.properties.dens_mass_const = 1000
-
-            me.fs.unit = GAC(
-                property_package=me.fs.properties,
-                film_transfer_coefficient_type="calculated",
-                surface_diffusion_coefficient_type="calculated",
-            )
-
-            me.fs.costing = WaterTAPCosting()
-            me.fs.costing.base_currency = pyo.units.USD_2020
-
-            me.fs.unit.costing = UnitModelCostingBlock(
-                flowsheet_costing_block=me.fs.costing,
-                costing_method_arguments={"contactor_type": "vessel"},
-            )
+@pytest.fixture(scope="module")
+def bg_model():
+    me = _empty_flowsheet()
+
+    me.fs.properties = MCASParameterBlock(
+        solute_list=bg_solutes,
+        mw_data=bg_mw_data,
+        charge=bg_charge,
+        diffus_calculation=DiffusivityCalculation.HaydukLaudie,
+        molar_volume_data=tce_molar_volume_data,
+        diffusivity_data=bg_diffusivity_data,
+    )
+    me.fs.properties.visc_d_phase["Liq"] = 1.3097e-3
+    me.fs.properties.dens_mass_const = 1000
+
+    return me
+
+
+@pytest.fixture(scope="module")
+def tce_only_model():
+    me = _empty_flowsheet()
+
+    me.fs.properties = MCASParameterBlock(
+        solute_list=["TCE"],
+        mw_data={"H2O": 0.018, "TCE": 0.1314},
+        diffus_calculation=DiffusivityCalculation.HaydukLaudie,
+        molar_volume_data=tce_molar_volume_data,
+    )
+    me.fs.properties.visc_d_phase["Liq"] = 1.3097e-3
+    me.fs.properties.dens_mass_const = 1000
+
+    return me
+
+
+match_no_target = re.compile(
+    r"'target species' is not specified for the GAC unit model, "
+    r"either specify 'target species' argument or reduce solute set "
+    r"to a single component"
+)
+match_contactor = re.compile(
+    r"fs\.unit received invalid argument for contactor_type: vessel\. "
+    r"Argument must be a member of the ContactorType Enum\."
+)
+match_target_type = re.compile(
+    r"item 0 within 'target_species' list is not of data type str"
+)
+match_target_component = re.compile(
+    r"item species within 'target_species' list is not in 'component_list"
+)
 
-        with pytest.raises(
-            ConfigurationError,
-            match="item 0 within 'target_species' list is not of data type str",
-        ):
-            me = ConcreteModel()
-            me.fs = FlowsheetBlock(dynamic=False)
-
-            # inserting arbitrary BackGround Solutes, Cations, and Anions to check handling
-            # arbitrary diffusivity data for non-target species
-            me.fs.properties = MCASParameterBlock(
-                solute_list=["TCE", "BGSOL", "BGCAT", "BGAN"],
-                mw_data={
-                    "H2O": 0.018,
-                    "TCE": 0.1314,
-                    "BGSOL": 0.1,
-                    "BGCAT": 0.1,
-                    "BGAN": 0.1,
-                },
-                charge={"BGCAT": 1, "BGAN": -2},
-                diffus_calculation=DiffusivityCalculation.HaydukLaudie,
-                molar_volume_data={("Liq", "TCE"): 9.81e-5},
-                diffusivity_data={
-                    ("Liq", "BGSOL"): 1e-5,
-                    ("Liq", "BGCAT"): 1e-5,
-                    ("Liq", "BGAN"): 1e-5,
-                },
-            )
-            me.fs.properties.visc_d_phase["Liq"] = 1.3097e-3
-            me.fs.properties.dens_mass_const = 1000
 
+class TestGACErrorLog:
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "model, gac_kwargs, contactor_type, match",
+        [
             # testing target_species arg
+            (
+                "bg_model",
+                {},
+                None,
+                match_no_target,
+            ),
+            (
+                "tce_only_model",
+                {},
+                "vessel",
+                match_contactor,
+            ),
+            (
+                "bg_model",
+                {"target_species": range(2)},
+                None,
+                match_target_type,
+            ),
+            (
+                "bg_model",
+                {"target_species": {"species": "TCE"}},
+                None,
+                match_target_component,
+            ),
+        ],
+        ids=[
+            "no_target_species",
+            "contactor_type",
+            "target_species_type",
+            "target_species_component",
+        ],
+    )
+    def test_error(self, request, model, gac_kwargs, contactor_type, match):
+        # the property package stays on its module-scoped model and is shared,
+        # not copied: no case solves or changes it, although the contactor_type
+        # case builds a complete unit and costing block against it
+        me = _empty_flowsheet()
+        add_object_reference(
+            me.fs, "properties", request.getfixturevalue(model).fs.properties
+        )
+
+        with pytest.raises(ConfigurationError, match=match):
             me.fs.unit = GAC(
                 property_package=me.fs.properties,
                 film_transfer_coefficient_type="calculated",
                 surface_diffusion_coefficient_type="calculated",
-                target_species=range(2),
-            )
-
-        with pytest.raises(
-            ConfigurationError,
-            match="item species within 'target_species' list is not in 'component_list",
-        ):
-            me = ConcreteModel()
-            me.fs = FlowsheetBlock(dynamic=False)
-
-            # inserting arbitrary BackGround Solutes, Cations, and Anions to check handling
-            # arbitrary diffusivity data for non-target species
-            me.fs.properties = MCASParameterBlock(
-                solute_list=["TCE", "BGSOL", "BGCAT", "BGAN"],
-                mw_data={
-                    "H2O": 0.018,
-                    "TCE": 0.1314,
-                    "BGSOL": 0.1,
-                    "BGCAT": 0.1,
-                    "BGAN": 0.1,
-                },
-                charge={"BGCAT": 1, "BGAN": -2},
-                diffus_calculation=DiffusivityCalculation.HaydukLaudie,
-                molar_volume_data={("Liq", "TCE"): 9.81e-5},
-                diffusivity_data={
-                    ("Liq", "BGSOL"): 1e-5,
-                    ("Liq", "BGCAT"): 1e-5,
-                    ("Liq", "BGAN"): 1e-5,
-                },
+                **gac_kwargs,
             )
-            me.fs.properties.visc_d_phase["Liq"] = 1.3097e-3
-            me.fs.properties.dens_mass_const = 1000
 
-            # testing target_species arg
-            me.fs.unit = GAC(
-                property_package=me.fs.properties,
-                film_transfer_coefficient_type="calculated",
-                surface_diffusion_coefficient_type="calculated",
-                target_species={"species": "TCE"},
-            )
+            if contactor_type is not None:
+                _attach_costing(me.fs, contactor_type=contactor_type)